@@ -3,53 +3,162 @@
 TOTP Manager - A command-line tool for managing TOTP secrets
 """
 
+import base64
+import cmd
+import csv
+import hashlib
 import sqlite3
+import struct
 import sys
+import time
 import os
-import pyotp
+from functools import lru_cache
 from pathlib import Path
 import getpass
 
 # Database path
 DB_PATH = Path.home() / '.totp_manager.db'
 
+# Stored in PRAGMA user_version once init_db() has created the schema
+SCHEMA_VERSION = 1
+
+# Streamed listings longer than this are re-queried on selection instead of kept
+SELECTION_CACHE_LIMIT = 100
+
+
+def _decode_secret(secret):
+    """Decode a base32 secret, padding it the same way pyotp does"""
+    missing_padding = len(secret) % 8
+    if missing_padding:
+        secret += '=' * (8 - missing_padding)
+    return base64.b32decode(secret, casefold=True)
+
+
+class FastTOTP:
+    """RFC 6238 TOTP (SHA1, 6 digits, 30s) with the HMAC key pads precomputed"""
+    
+    def __init__(self, secret):
+        key = _decode_secret(secret)
+        if len(key) > 64:
+            key = hashlib.sha1(key).digest()
+        key = key.ljust(64, b'\0')
+        self._inner = hashlib.sha1(bytes(b ^ 0x36 for b in key))
+        self._outer = hashlib.sha1(bytes(b ^ 0x5c for b in key))
+    
+    def at_counter(self, counter):
+        """Generate the code for an 8-byte big-endian counter"""
+        inner = self._inner.copy()
+        inner.update(counter)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        digest = outer.digest()
+        offset = digest[-1] & 0xf
+        code = struct.unpack_from('>I', digest, offset)[0] & 0x7fffffff
+        return f'{code % 1_000_000:06d}'
+    
+    def at(self, for_time):
+        """Generate the code for a Unix timestamp"""
+        return self.at_counter(struct.pack('>Q', int(for_time) // 30))
+    
+    def now(self):
+        """Generate the code for the current time"""
+        return self.at(time.time())
+
+
+@lru_cache(maxsize=256)
+def _totp_for(secret):
+    """Return a cached TOTP generator for a secret"""
+    return FastTOTP(secret)
+
+
+# Generated codes keyed by (secret, 30-second time step)
+_code_cache = {}
+
 
 class TOTPManager:
-    def __init__(self, db_path=DB_PATH):
+    def __init__(self, db_path=DB_PATH, readonly=False):
         self.db_path = db_path
-        self.init_db()
+        self.readonly = readonly
+        self._conn = None
+        if readonly:
+            if self.get_schema_version() >= SCHEMA_VERSION:
+                return
+            # Uninitialized database: reopen read-write so init_db() can run
+            self.close()
+            self.readonly = False
+        if not Path(self.db_path).exists() or self.get_schema_version() < SCHEMA_VERSION:
+            self.init_db()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def _get_conn(self):
+        """Return the shared database connection, opening it on first use
+        
+        Read-only managers open the database with mode=ro, which skips write
+        locking; the journal settings are left to the last read-write open.
+        SQLite still creates the -wal and -shm files for a WAL database opened
+        this way, and only a read-write close removes them.
+        """
+        if self._conn is None:
+            if self.readonly:
+                uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+                conn = self._conn = sqlite3.connect(uri, uri=True)
+            else:
+                conn = self._conn = sqlite3.connect(self.db_path)
+                conn.execute('PRAGMA journal_mode = WAL')
+                conn.execute('PRAGMA synchronous = NORMAL')
+            conn.execute('PRAGMA temp_store = MEMORY')
+            conn.execute('PRAGMA cache_size = -64000')
+            conn.execute('PRAGMA mmap_size = 134217728')
+        return self._conn
+    
+    def close(self):
+        """Close the shared database connection if it is open"""
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            conn.close()
+            self._conn = None
+    
+    def get_schema_version(self):
+        """Return the schema version recorded in the database"""
+        return self._get_conn().execute('PRAGMA user_version').fetchone()[0]
     
     def init_db(self):
         """Initialize the database and create table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS totp_secrets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                secret TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        with self._get_conn() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS totp_secrets (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    email TEXT UNIQUE NOT NULL,
+                    secret TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_email_nocase ON totp_secrets (email COLLATE NOCASE)'
             )
-        ''')
-        conn.commit()
-        conn.close()
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
     
     def add_secret(self, email, secret):
         """Add a new TOTP secret"""
         try:
             # Validate secret format
             secret = secret.replace(' ', '').upper()
-            pyotp.TOTP(secret).now()  # Test if secret is valid
+            _decode_secret(secret)  # Raises binascii.Error if invalid
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                'INSERT INTO totp_secrets (email, secret) VALUES (?, ?)',
-                (email, secret)
-            )
-            conn.commit()
-            conn.close()
+            with self._get_conn() as conn:
+                conn.execute(
+                    'INSERT INTO totp_secrets (email, secret) VALUES (?, ?)',
+                    (email, secret)
+                )
             print(f"✓ Successfully added TOTP secret for {email}")
             return True
         except sqlite3.IntegrityError:
@@ -59,25 +168,49 @@ class TOTPManager:
             print(f"✗ Error: Invalid secret format - {e}")
             return False
     
+    def add_secrets_bulk(self, pairs):
+        """Add many (email, secret) pairs in a single transaction
+        
+        Pairs whose secret is not valid base32 and emails that already exist
+        are skipped. Returns a tuple of
+        (added, duplicates, invalid) counts.
+        """
+        rows = []
+        invalid = 0
+        for email, secret in pairs:
+            secret = secret.replace(' ', '').upper()
+            try:
+                _decode_secret(secret)
+            except ValueError:  # binascii.Error or non-ASCII input
+                invalid += 1
+                continue
+            rows.append((email, secret))
+        
+        conn = self._get_conn()
+        before = conn.total_changes
+        with conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO totp_secrets (email, secret) VALUES (?, ?)',
+                rows
+            )
+        added = conn.total_changes - before
+        return added, len(rows) - added, invalid
+    
     def update_secret(self, email, new_secret):
         """Update an existing TOTP secret"""
         try:
             # Validate secret format
             new_secret = new_secret.replace(' ', '').upper()
-            pyotp.TOTP(new_secret).now()  # Test if secret is valid
+            _decode_secret(new_secret)  # Raises binascii.Error if invalid
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                'UPDATE totp_secrets SET secret = ?, updated_at = CURRENT_TIMESTAMP WHERE email = ?',
-                (new_secret, email)
-            )
-            if cursor.rowcount == 0:
+            with self._get_conn() as conn:
+                result = conn.execute(
+                    'UPDATE totp_secrets SET secret = ?, updated_at = CURRENT_TIMESTAMP WHERE email = ?',
+                    (new_secret, email)
+                )
+            if result.rowcount == 0:
                 print(f"✗ Error: Email {email} not found")
-                conn.close()
                 return False
-            conn.commit()
-            conn.close()
             print(f"✓ Successfully updated TOTP secret for {email}")
             return True
         except Exception as e:
@@ -86,56 +219,316 @@ class TOTPManager:
     
     def delete_secret(self, email):
         """Delete a TOTP secret"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM totp_secrets WHERE email = ?', (email,))
-        if cursor.rowcount == 0:
+        with self._get_conn() as conn:
+            result = conn.execute('DELETE FROM totp_secrets WHERE email = ?', (email,))
+        if result.rowcount == 0:
             print(f"✗ Error: Email {email} not found")
-            conn.close()
             return False
-        conn.commit()
-        conn.close()
         print(f"✓ Successfully deleted TOTP secret for {email}")
         return True
     
     def search_emails(self, search_term):
-        """Search for emails containing the search term"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+        """Search for emails containing the search term, preferring an exact match"""
+        row = self.search_emails_first(search_term)
+        if row:
+            return [row]
+        return self.search_emails_all(search_term)
+    
+    def search_emails_first(self, email):
+        """Return the row for an exact email via the unique index, or None"""
+        return self._get_conn().execute(
+            'SELECT id, email, secret FROM totp_secrets WHERE email = ? LIMIT 1',
+            (email,)
+        ).fetchone()
+    
+    def search_emails_all(self, search_term):
+        """Return all rows matching the search term, ordered by email
+        
+        The term is first tried as a case-insensitive prefix, which SQLite
+        serves as a range scan of idx_email_nocase already in NOCASE order. The
+        substring fallback uses a leading '%' and always scans the table.
+        """
+        conn = self._get_conn()
+        # The pattern must be bound whole; "LIKE ? || '%'" defeats the index
+        prefix = (
+            search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        )
+        results = conn.execute(
+            "SELECT id, email, secret FROM totp_secrets WHERE email LIKE ? ESCAPE '\\' "
+            'ORDER BY email COLLATE NOCASE',
+            (prefix,)
+        ).fetchall()
+        if results:
+            return results
+        return conn.execute(
             'SELECT id, email, secret FROM totp_secrets WHERE email LIKE ? ORDER BY email',
             (f'%{search_term}%',)
-        )
-        results = cursor.fetchall()
-        conn.close()
-        return results
+        ).fetchall()
     
     def get_all_emails(self):
-        """Get all emails from the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, email, secret FROM totp_secrets ORDER BY email')
-        results = cursor.fetchall()
-        conn.close()
-        return results
+        """Get all emails from the database as a cursor that streams rows"""
+        return self._get_conn().execute(
+            'SELECT id, email, secret FROM totp_secrets ORDER BY email'
+        )
+    
+    def get_email_at(self, index):
+        """Get the row at a zero-based position in the get_all_emails() order"""
+        return self._get_conn().execute(
+            'SELECT id, email, secret FROM totp_secrets ORDER BY email LIMIT 1 OFFSET ?',
+            (index,)
+        ).fetchone()
     
     def get_totp(self, secret):
         """Generate TOTP code from secret"""
-        totp = pyotp.TOTP(secret)
-        return totp.now()
-    
-    def display_results(self, results):
-        """Display search results and return them for selection"""
-        if not results:
-            print("No matching emails found.")
-            return None
+        now = time.time()
+        key = (secret, int(now) // 30)
+        code = _code_cache.get(key)
+        if code is None:
+            if len(_code_cache) >= 256:
+                _code_cache.clear()
+            code = _code_cache[key] = _totp_for(secret).at(now)
+        return code
+    
+    def get_totp_for_email(self, email):
+        """Return (email, code) for an exact email match, or None"""
+        row = self.search_emails_first(email)
+        return (email, self.get_totp(row[2])) if row else None
+    
+    def get_all_totps(self):
+        """Yield (id, email, code) for every stored secret at the same time step
         
-        print("\nFound emails:")
+        The code is None for a stored secret that is not valid base32.
+        """
+        counter = struct.pack('>Q', int(time.time()) // 30)
+        rows = self._get_conn().execute(
+            'SELECT id, email, secret FROM totp_secrets ORDER BY email'
+        )
+        for db_id, email, secret in rows:
+            try:
+                totp = _totp_for(secret)
+            except ValueError:  # binascii.Error or non-ASCII input
+                yield db_id, email, None
+                continue
+            yield db_id, email, totp.at_counter(counter)
+    
+    def display_results(self, results, empty_message="No matching emails found.",
+                        streamed=False):
+        """Display results as they are read and return (count, rows) for selection
+        
+        A list is returned unchanged as rows. With streamed=True results may be
+        any iterable; rows is None once more than SELECTION_CACHE_LIMIT rows
+        were shown, and the caller re-queries the selected row with
+        get_email_at().
+        """
+        rows = [] if streamed else results
+        count = 0
+        for count, row in enumerate(results, 1):
+            if count == 1:
+                print("\nFound emails:")
+                print("-" * 60)
+            print(f"{count}. {row[1]}")
+            if streamed and rows is not None:
+                rows.append(row)
+                if count > SELECTION_CACHE_LIMIT:
+                    rows = None
+        if not count:
+            print(empty_message)
+            return 0, None
         print("-" * 60)
-        for idx, (db_id, email, secret) in enumerate(results, 1):
-            print(f"{idx}. {email}")
+        return count, rows
+
+
+def _ask(prompt):
+    """Read a line of input, treating Ctrl-D and Ctrl-C as an empty answer"""
+    try:
+        return input(prompt).strip()
+    except (EOFError, KeyboardInterrupt):
+        print()
+        return ''
+
+
+def print_totp(email, totp_code):
+    """Print the TOTP code for an email"""
+    print(f"\nTOTP code for {email}:")
+    print(f"  {totp_code}")
+
+
+def select_and_print(manager, count, displayed, prompt):
+    """Ask for a displayed row number and print that row's TOTP code
+    
+    Returns an exit status: 0 when a code was shown or the user cancelled,
+    1 for invalid input.
+    """
+    choice = _ask(prompt)
+    if not choice:
+        print("Cancelled.")
+        return 0
+    try:
+        choice_idx = int(choice) - 1
+    except ValueError:
+        print("Invalid input.")
+        return 1
+    if not 0 <= choice_idx < count:
+        print("Invalid selection.")
+        return 1
+    if displayed is not None:
+        row = displayed[choice_idx]
+    else:
+        row = manager.get_email_at(choice_idx)
+    if row is None:
+        # The table shrank between display and selection
+        print("Invalid selection.")
+        return 1
+    db_id, email, secret = row
+    print_totp(email, manager.get_totp(secret))
+    return 0
+
+
+def get_and_print(manager, search_term):
+    """Print the code for an exact email or let the user pick a search match
+    
+    Returns an exit status like select_and_print().
+    """
+    exact = manager.get_totp_for_email(search_term)
+    if exact:
+        print_totp(*exact)
+        return 0
+    results = manager.search_emails_all(search_term)
+    if not results:
+        print(f"No emails found matching '{search_term}'")
+        return 1
+    if len(results) == 1:
+        # Single search result
+        db_id, email, secret = results[0]
+        print_totp(email, manager.get_totp(secret))
+        return 0
+    # Multiple matches, let user choose
+    count, displayed = manager.display_results(results)
+    return select_and_print(
+        manager, count, displayed, "\nSelect email number (or press Enter to cancel): "
+    )
+
+
+def list_and_print(manager):
+    """List all emails and print the code of the one the user picks
+    
+    Returns an exit status like select_and_print().
+    """
+    count, displayed = manager.display_results(
+        manager.get_all_emails(), empty_message="No TOTP secrets stored yet.", streamed=True
+    )
+    if not count:
+        return 0
+    return select_and_print(
+        manager, count, displayed,
+        "\nSelect email number to get TOTP (or press Enter to cancel): "
+    )
+
+
+def print_codes(manager):
+    """Print the current TOTP code for every stored email"""
+    count = 0
+    for count, (db_id, email, totp_code) in enumerate(manager.get_all_totps(), 1):
+        if count == 1:
+            print("-" * 60)
+        print(f"{totp_code or 'invalid secret'}  {email}")
+    if count:
         print("-" * 60)
-        return results
+    else:
+        print("No TOTP secrets stored yet.")
+
+
+def confirm_and_delete(manager, email):
+    """Ask for confirmation and delete the secret for an email"""
+    confirm = _ask(f"Are you sure you want to delete {email}? (yes/no): ")
+    if confirm.lower() == 'yes':
+        manager.delete_secret(email)
+    else:
+        print("Deletion cancelled.")
+
+
+class TOTPShell(cmd.Cmd):
+    """Interactive session that reuses one TOTPManager across commands"""
+    
+    intro = "TOTP Manager shell. Type help or ? to list commands."
+    prompt = "totp> "
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+    
+    def cmdloop(self, intro=None):
+        """Run the loop, returning to the prompt after Ctrl-C"""
+        while True:
+            try:
+                return super().cmdloop(intro)
+            except KeyboardInterrupt:
+                print()
+                intro = ''
+    
+    def onecmd(self, line):
+        """Run one command, reporting errors instead of ending the session"""
+        try:
+            return super().onecmd(line)
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            return False
+    
+    def emptyline(self):
+        pass
+    
+    def do_get(self, arg):
+        """get <email|search_term>: Get TOTP code by exact email or search term"""
+        search_term = arg.strip()
+        if not search_term:
+            print("Usage: get <email|search_term>")
+            return
+        get_and_print(self.manager, search_term)
+    
+    def do_search(self, arg):
+        """search <search_term>: List emails matching the search term"""
+        self.manager.display_results(self.manager.search_emails(arg.strip()))
+    
+    def do_list(self, arg):
+        """list: List all emails and select one to get TOTP"""
+        list_and_print(self.manager)
+    
+    def do_codes(self, arg):
+        """codes: Show the current TOTP code for every email"""
+        print_codes(self.manager)
+    
+    def do_add(self, arg):
+        """add <email> <secret>: Add a new TOTP secret"""
+        parts = arg.split(maxsplit=1)
+        if len(parts) != 2:
+            print("Usage: add <email> <secret>")
+            return
+        self.manager.add_secret(*parts)
+    
+    def do_update(self, arg):
+        """update <email> <secret>: Update an existing TOTP secret"""
+        parts = arg.split(maxsplit=1)
+        if len(parts) != 2:
+            print("Usage: update <email> <secret>")
+            return
+        self.manager.update_secret(*parts)
+    
+    def do_delete(self, arg):
+        """delete <email>: Delete a TOTP secret"""
+        email = arg.strip()
+        if not email:
+            print("Usage: delete <email>")
+            return
+        confirm_and_delete(self.manager, email)
+    
+    def do_quit(self, arg):
+        """quit: Leave the shell"""
+        return True
+    
+    def do_EOF(self, arg):
+        """Leave the shell on end of input"""
+        print()
+        return True
 
 
 def print_usage():
@@ -149,128 +542,103 @@ Usage:
 Commands:
     get <email|search_term>    Get TOTP code by exact email or search term
     list                       List all emails and select one to get TOTP
+    codes                      Show the current TOTP code for every email
     add <email> <secret>       Add a new TOTP secret
     update <email> <secret>    Update an existing TOTP secret
+    import <file>              Import email,secret rows from a CSV file
     delete <email>             Delete a TOTP secret
+    shell                      Start an interactive session
     help                       Show this help message
 
 Examples:
     python totp_manager.py get john@example.com
     python totp_manager.py get example
     python totp_manager.py list
+    python totp_manager.py codes
     python totp_manager.py add john@example.com JBSWY3DPEHPK3PXP
     python totp_manager.py update john@example.com NEWBASE32SECRET
+    python totp_manager.py import backup.csv
     python totp_manager.py delete john@example.com
+    python totp_manager.py shell
     """)
 
 
 def main():
-    manager = TOTPManager()
-    
     if len(sys.argv) < 2:
         print_usage()
         sys.exit(1)
     
     command = sys.argv[1].lower()
+    # Commands that never write open an existing database read-only
+    readonly = command in ('get', 'list', 'codes', 'help') and DB_PATH.exists()
     
-    if command == 'help':
-        print_usage()
+    with TOTPManager(readonly=readonly) as manager:
+        if command == 'help':
+            print_usage()
     
-    elif command == 'add':
-        if len(sys.argv) != 4:
-            print("Usage: python totp_manager.py add <email> <secret>")
-            sys.exit(1)
-        email = sys.argv[2]
-        secret = sys.argv[3]
-        manager.add_secret(email, secret)
+        elif command == 'shell':
+            TOTPShell(manager).cmdloop()
     
-    elif command == 'update':
-        if len(sys.argv) != 4:
-            print("Usage: python totp_manager.py update <email> <secret>")
-            sys.exit(1)
-        email = sys.argv[2]
-        secret = sys.argv[3]
-        manager.update_secret(email, secret)
+        elif command == 'add':
+            if len(sys.argv) != 4:
+                print("Usage: python totp_manager.py add <email> <secret>")
+                sys.exit(1)
+            email = sys.argv[2]
+            secret = sys.argv[3]
+            manager.add_secret(email, secret)
     
-    elif command == 'delete':
-        if len(sys.argv) != 3:
-            print("Usage: python totp_manager.py delete <email>")
-            sys.exit(1)
-        email = sys.argv[2]
-        # Confirm deletion
-        confirm = input(f"Are you sure you want to delete {email}? (yes/no): ")
-        if confirm.lower() == 'yes':
-            manager.delete_secret(email)
-        else:
-            print("Deletion cancelled.")
+        elif command == 'update':
+            if len(sys.argv) != 4:
+                print("Usage: python totp_manager.py update <email> <secret>")
+                sys.exit(1)
+            email = sys.argv[2]
+            secret = sys.argv[3]
+            manager.update_secret(email, secret)
     
-    elif command == 'get':
-        if len(sys.argv) != 3:
-            print("Usage: python totp_manager.py get <email|search_term>")
-            sys.exit(1)
-        search_term = sys.argv[2]
-        results = manager.search_emails(search_term)
-        
-        if not results:
-            print(f"No emails found matching '{search_term}'")
-            sys.exit(1)
-        
-        if len(results) == 1:
-            # Exact match or single result
-            db_id, email, secret = results[0]
-            totp_code = manager.get_totp(secret)
-            print(f"\nTOTP code for {email}:")
-            print(f"  {totp_code}")
-        else:
-            # Multiple matches, let user choose
-            displayed = manager.display_results(results)
+        elif command == 'import':
+            if len(sys.argv) != 3:
+                print("Usage: python totp_manager.py import <file>")
+                sys.exit(1)
+            csv_path = sys.argv[2]
             try:
-                choice = input("\nSelect email number (or press Enter to cancel): ").strip()
-                if not choice:
-                    print("Cancelled.")
-                    sys.exit(0)
-                choice_idx = int(choice) - 1
-                if 0 <= choice_idx < len(displayed):
-                    db_id, email, secret = displayed[choice_idx]
-                    totp_code = manager.get_totp(secret)
-                    print(f"\nTOTP code for {email}:")
-                    print(f"  {totp_code}")
-                else:
-                    print("Invalid selection.")
-                    sys.exit(1)
-            except ValueError:
-                print("Invalid input.")
+                with open(csv_path, newline='') as f:
+                    pairs = [row[:2] for row in csv.reader(f) if len(row) >= 2]
+            except OSError as e:
+                print(f"✗ Error: Could not read {csv_path} - {e}")
                 sys.exit(1)
+            # A first row without an email address (e.g. "email,secret") is a header
+            if pairs and '@' not in pairs[0][0]:
+                print(f"  Skipping header row: {','.join(pairs[0])}")
+                pairs = pairs[1:]
+            added, duplicates, invalid = manager.add_secrets_bulk(pairs)
+            print(f"✓ Imported {added} of {len(pairs)} TOTP secrets from {csv_path}")
+            if duplicates:
+                print(f"  Skipped {duplicates} already stored email(s)")
+            if invalid:
+                print(f"  Skipped {invalid} row(s) with an invalid secret")
     
-    elif command == 'list':
-        results = manager.get_all_emails()
-        if not results:
-            print("No TOTP secrets stored yet.")
-            sys.exit(0)
-        
-        displayed = manager.display_results(results)
-        try:
-            choice = input("\nSelect email number to get TOTP (or press Enter to cancel): ").strip()
-            if not choice:
-                print("Cancelled.")
-                sys.exit(0)
-            choice_idx = int(choice) - 1
-            if 0 <= choice_idx < len(displayed):
-                db_id, email, secret = displayed[choice_idx]
-                totp_code = manager.get_totp(secret)
-                print(f"\nTOTP code for {email}:")
-                print(f"  {totp_code}")
-            else:
-                print("Invalid selection.")
+        elif command == 'delete':
+            if len(sys.argv) != 3:
+                print("Usage: python totp_manager.py delete <email>")
                 sys.exit(1)
-        except ValueError:
-            print("Invalid input.")
-            sys.exit(1)
+            confirm_and_delete(manager, sys.argv[2])
     
-    else:
-        print(f"Unknown command: {command}")
-        print_usage()
-        sys.exit(1)
+        elif command == 'get':
+            if len(sys.argv) != 3:
+                print("Usage: python totp_manager.py get <email|search_term>")
+                sys.exit(1)
+            sys.exit(get_and_print(manager, sys.argv[2]))
+    
+        elif command == 'list':
+            sys.exit(list_and_print(manager))
+    
+        elif command == 'codes':
+            print_codes(manager)
+    
+        else:
+            print(f"Unknown command: {command}")
+            print_usage()
+            sys.exit(1)
 
 
 if __name__ == '__main__':